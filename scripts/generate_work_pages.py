@@ -16,9 +16,13 @@ YAML typing rules enforced by this script (so Excel cells do NOT need quoting):
 - Everything else is emitted as a quoted string (including dates like catalogue_date and fields like year_display)
 - Empty cells become YAML null
 
+Workbook parsing uses python-calamine when it is installed (much faster), otherwise openpyxl;
+choose explicitly with --reader (`--reader iterparse` streams the sheet XML with the stdlib parser).
+
 Safe by default:
 - dry-run unless you pass --write
-- will not overwrite unless --force
+- skips pages whose stored checksum matches unless --force
+- never rewrites a file whose content is unchanged (even with --force)
 
 Example:
   python3 scripts/generate_work_pages.py data/works.xlsx --write
@@ -28,29 +32,62 @@ from __future__ import annotations
 
 import argparse
 import datetime as dt
+import os
+import posixpath
 import re
+import xml.etree.ElementTree as ET
+import zipfile
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional, Tuple
 
 import hashlib
 import json
 
 import openpyxl
 
+try:
+    # Optional: native (Rust) xlsx parser, much faster than openpyxl. pip install python-calamine
+    from python_calamine import CalamineWorkbook
+except ImportError:
+    CalamineWorkbook = None
+
 
 # ----------------------------
 # Helpers (ID/date/YAML parsing)
 # ----------------------------
 # These functions exist to normalise common Excel quirks (e.g. numeric IDs like 361.0)
 # and to keep YAML output safe/consistent.
+# Patterns are compiled once here since the helpers run for every row.
+_RE_TRAILING_DOT_ZERO = re.compile(r"\.0$")
+_RE_NON_DIGIT = re.compile(r"\D")
+_RE_NON_SLUG_CHARS = re.compile(r"[^a-z0-9]+")
+_RE_REPEATED_DASH = re.compile(r"-+")
+_RE_SLUG_SAFE = re.compile(r"^[a-z0-9]+(?:-[a-z0-9]+)*$")
+_RE_ISO_DATE = re.compile(r"^(\d{4})-(\d{1,2})-(\d{1,2})$")
+# parse_list splitters: one pass splits on the separator and drops surrounding whitespace
+_LIST_SPLITTERS: Dict[str, re.Pattern] = {
+    ",": re.compile(r"\s*,\s*"),
+    ";": re.compile(r"\s*;\s*"),
+}
+
+
 def slug_id(raw: Any, width: int = 5) -> str:
     if raw is None:
         raise ValueError("Missing id")
-    s = str(raw).strip()
+    if isinstance(raw, float) and raw.is_integer():
+        s = str(int(raw))
+    else:
+        s = str(raw).strip()
+    # Fast path: ints and plain digit strings (the usual case) need no regex work.
+    # isdecimal() matches exactly what \D would keep.
+    if s.isdecimal():
+        return s.zfill(width)
     # Handle numeric IDs like 361.0 from Excel
-    s = re.sub(r"\.0$", "", s)
+    s = _RE_TRAILING_DOT_ZERO.sub("", s)
     # NOTE: This strips ALL non-digits. If your IDs ever include prefixes/suffixes, change this logic.
-    s = re.sub(r"\D", "", s)  # keep digits only
+    s = _RE_NON_DIGIT.sub("", s)  # keep digits only
     if not s:
         raise ValueError(f"Invalid id value: {raw!r}")
     return s.zfill(width)
@@ -63,15 +100,15 @@ def slugify_text(raw: Any) -> str:
         raise ValueError("Missing text")
     s = str(raw).strip().lower()
     # Replace non-alphanumerics with hyphens
-    s = re.sub(r"[^a-z0-9]+", "-", s)
-    s = re.sub(r"-+", "-", s).strip("-")
+    s = _RE_NON_SLUG_CHARS.sub("-", s)
+    s = _RE_REPEATED_DASH.sub("-", s).strip("-")
     if not s:
         raise ValueError(f"Invalid slug source: {raw!r}")
     return s
 
 
 def is_slug_safe(s: str) -> bool:
-    return bool(re.match(r"^[a-z0-9]+(?:-[a-z0-9]+)*$", s))
+    return bool(_RE_SLUG_SAFE.match(s))
 
 
 def require_slug_safe(label: str, raw: Any) -> str:
@@ -96,7 +133,7 @@ def parse_date(raw: Any) -> Optional[str]:
     s = str(raw).strip()
     # NOTE: Prefer real Excel date cells or ISO strings in the workbook; anything else may pass through unchanged.
     # Accept YYYY-M-D and normalise to YYYY-MM-DD if possible
-    m = re.match(r"^(\d{4})-(\d{1,2})-(\d{1,2})$", s)
+    m = _RE_ISO_DATE.match(s)
     if m:
         y, mo, d = map(int, m.groups())
         return dt.date(y, mo, d).isoformat()
@@ -110,18 +147,21 @@ def parse_list(raw: Any, sep: str = ",") -> List[str]:
     s = str(raw).strip()
     if not s:
         return []
-    return [item.strip() for item in s.split(sep) if item.strip()]
+    splitter = _LIST_SPLITTERS.get(sep)
+    if splitter is None:
+        splitter = _LIST_SPLITTERS.setdefault(sep, re.compile(rf"\s*{re.escape(sep)}\s*"))
+    return [item for item in splitter.split(s) if item]
 
 
 def yaml_quote(s: str) -> str:
     """Quote a string safely for YAML."""
+    # Most values contain neither character, so skip the two replace() passes.
+    if "\\" not in s and '"' not in s:
+        return f'"{s}"'
     s = s.replace("\\", "\\\\").replace('"', '\\"')
     return f'"{s}"'
 
 
-NUMERIC_KEYS = {"year", "height_cm", "width_cm", "depth_cm"}
-
-
 def is_empty(value: Any) -> bool:
     if value is None:
         return True
@@ -158,33 +198,51 @@ def coerce_int(value: Any) -> Optional[int]:
 
 def coerce_string(value: Any) -> Optional[str]:
     """Coerce any non-empty value to a trimmed string (for quoted YAML output)."""
-    if is_empty(value):
+    if value is None:
         return None
+    if isinstance(value, str):
+        # Strip once: the common case, and already-coerced values pass through here again on dump
+        return value.strip() or None
     return str(value).strip()
 
 
-def dump_scalar(key: str, value: Any) -> str:
-    """Dump a scalar YAML key/value with typing rules."""
-    if value is None:
+def _dump_year(key: str, value: Any) -> str:
+    iv = coerce_int(value)
+    return f"{key}: {iv}" if iv is not None else f"{key}: null"
+
+
+def _dump_dimension(key: str, value: Any) -> str:
+    # Dimensions are floats but we render ints without .0
+    fv = coerce_numeric(value)
+    if fv is None:
         return f"{key}: null"
+    if fv.is_integer():
+        return f"{key}: {int(fv)}"
+    return f"{key}: {fv}"
 
-    if key in NUMERIC_KEYS:
-        # year is an int; dimensions are floats but we render ints without .0
-        if key == "year":
-            iv = coerce_int(value)
-            return f"{key}: {iv}" if iv is not None else f"{key}: null"
-        fv = coerce_numeric(value)
-        if fv is None:
-            return f"{key}: null"
-        if fv.is_integer():
-            return f"{key}: {int(fv)}"
-        return f"{key}: {fv}"
-
-    # Everything else is a quoted string
+
+def _dump_string(key: str, value: Any) -> str:
     sv = coerce_string(value)
     return f"{key}: {yaml_quote(sv)}" if sv is not None else f"{key}: null"
 
 
+# Keys emitted as unquoted numbers, with their dumpers; every other key is a quoted string.
+# A dict lookup per field replaces the membership test + if-chain.
+SCALAR_DUMPERS: Dict[str, Callable[[str, Any], str]] = {
+    "year": _dump_year,
+    "height_cm": _dump_dimension,
+    "width_cm": _dump_dimension,
+    "depth_cm": _dump_dimension,
+}
+
+
+def dump_scalar(key: str, value: Any) -> str:
+    """Dump a scalar YAML key/value with typing rules."""
+    if value is None:
+        return f"{key}: null"
+    return SCALAR_DUMPERS.get(key, _dump_string)(key, value)
+
+
 def dump_list_of_strings(key: str, values: List[str]) -> List[str]:
     lines: List[str] = [f"{key}:"]
     for v in values:
@@ -212,8 +270,12 @@ def dump_list_of_dicts(key: str, items: List[Dict[str, Any]], field_order: Optio
 
 
 
-def build_front_matter(fields: Dict[str, Any]) -> str:
-    """Build YAML front matter in block style (supports lists of dicts)."""
+def build_front_matter(fields: Dict[str, Any], body: Optional[str] = None) -> str:
+    """Build YAML front matter in block style (supports lists of dicts).
+
+    If `body` is given, the full page is returned (front matter, blank line, body), assembled
+    in the same join rather than by concatenating the front matter string afterwards.
+    """
     # Policy: we intentionally emit explicit empty values to keep the front matter schema stable.
     # - Empty/blank scalars become `key: null`
     # - Empty lists become `key: []`
@@ -242,7 +304,12 @@ def build_front_matter(fields: Dict[str, Any]) -> str:
         lines.append(dump_scalar(k, v))
 
     lines.append("---")
-    return "\n".join(lines) + "\n"
+    if body is not None:
+        lines.append("")
+        lines.append(body)
+    else:
+        lines.append("")  # trailing newline after the closing ---
+    return "\n".join(lines)
 
 
 # ----------------------------
@@ -273,13 +340,48 @@ WORKS_SCHEMA: List[tuple[str, str, Any]] = [
 ]
 
 
-def build_works_front_matter(works_row: tuple, works_hi: Dict[str, int]) -> Dict[str, Any]:
-    """Build the scalar portion of Works front matter (excluding work_id, tags, images, attachments)."""
-    fm: Dict[str, Any] = {}
+def cell_at(row: tuple, i: Optional[int]) -> Any:
+    """Return row[i], or None if the column is absent (i is None) or the row is short."""
+    return None if i is None or i >= len(row) else row[i]
+
+
+def make_works_front_matter_builder(
+    works_hi: Dict[str, int],
+    series_title_by_id: Dict[str, str],
+) -> Callable[[tuple], Dict[str, Any]]:
+    """Specialise Works front matter building to this workbook's header row.
+
+    The returned function builds the scalar portion of Works front matter for one row
+    (excluding work_id, tags, images, attachments). Columns missing from the sheet are
+    resolved here, once: they stay null in a pre-ordered template and cost nothing per row.
+    series_title is looked up from the Series sheet and placed immediately after series_id.
+    """
+    template: Dict[str, Any] = {}
+    present: List[tuple[str, int, Any]] = []
     for fm_key, col_name, coercer in WORKS_SCHEMA:
-        raw = works_row[works_hi[col_name]] if col_name in works_hi else None
-        fm[fm_key] = coercer(raw)
-    return fm
+        template[fm_key] = None
+        if fm_key == "series_id":
+            template["series_title"] = None
+        i = works_hi.get(col_name)
+        if i is not None:
+            present.append((fm_key, i, coercer))
+    width = max((i for _, i, _ in present), default=-1) + 1
+    has_series_id = any(fm_key == "series_id" for fm_key, _, _ in present)
+
+    def build_works_front_matter(works_row: tuple) -> Dict[str, Any]:
+        # Pad short rows once so every present column can be indexed directly.
+        if len(works_row) < width:
+            works_row = works_row + (None,) * (width - len(works_row))
+        fm = dict(template)
+        for fm_key, i, coercer in present:
+            fm[fm_key] = coercer(works_row[i])
+        if has_series_id:
+            # Works.series_id -> Series.series_title (value is already trimmed by coerce_string)
+            sid = fm["series_id"]
+            fm["series_title"] = series_title_by_id.get(sid) if sid else None
+        return fm
+
+    return build_works_front_matter
 
 
 # ----------------------------
@@ -309,11 +411,11 @@ def compute_work_checksum(front_matter: Dict[str, Any]) -> str:
     return h.hexdigest()
 
 
-def extract_existing_checksum(path: Path) -> Optional[str]:
-    """Extract `checksum` from the YAML front matter of an existing work page."""
+def extract_existing_checksum(data: bytes) -> Optional[str]:
+    """Extract `checksum` from the YAML front matter of an existing work page (raw file bytes)."""
     try:
-        text = path.read_text(encoding="utf-8")
-    except Exception:
+        text = data.decode("utf-8")
+    except UnicodeDecodeError:
         return None
 
     # Only inspect the first YAML front matter block
@@ -349,10 +451,10 @@ def compute_series_hash(series_id: str, work_ids: List[str]) -> str:
     return hashlib.blake2b(canonical, digest_size=16).hexdigest()
 
 
-def extract_existing_series_hash(path: Path) -> Optional[str]:
-    """Extract header.hash from an existing series JSON file."""
+def extract_existing_series_hash(data: bytes) -> Optional[str]:
+    """Extract header.hash from an existing series JSON file (raw file bytes)."""
     try:
-        obj = json.loads(path.read_text(encoding="utf-8"))
+        obj = json.loads(data)
     except Exception:
         return None
     header = obj.get("header") if isinstance(obj, dict) else None
@@ -364,6 +466,326 @@ def extract_existing_series_hash(path: Path) -> Optional[str]:
     s = str(hv).strip()
     return s or None
 
+# ----------------------------
+# File output helpers
+# ----------------------------
+
+# Generated content is encoded to UTF-8 once; the same bytes are compared against the
+# existing file and written, so nothing is decoded/encoded twice.
+
+def read_existing_bytes(path: Path) -> Optional[bytes]:
+    """Read a previously generated file, or None if it is missing/unreadable."""
+    try:
+        return path.read_bytes()
+    except Exception:
+        return None
+
+
+def write_file(path: Path, payload: bytes) -> None:
+    """Write an encoded payload with one open/write/close."""
+    # Unbuffered: the whole payload goes out in one write(), so a per-file BufferedWriter
+    # (and its internal buffer) would only add an allocation and a copy.
+    with open(path, "wb", buffering=0) as f:
+        view = memoryview(payload)
+        while view:
+            # Raw writes may be partial; continue from where the last one stopped.
+            view = view[f.write(view):]
+
+
+def sync_work_page(out_path: Path, content: str, checksum: str, exists: bool, force: bool, write: bool) -> str:
+    """Compare a rendered work page with the file on disk and write it if needed.
+
+    Returns "checksum" or "unchanged" if the page was skipped, "write" if it was written
+    (or would be, in dry-run). Runs on worker threads with --jobs > 1, so it must not print.
+    """
+    existing = read_existing_bytes(out_path) if exists else None
+    if not force and existing is not None and extract_existing_checksum(existing) == checksum:
+        return "checksum"
+
+    # With --force the checksum is bypassed; still avoid rewriting byte-identical pages.
+    payload = content.encode("utf-8")
+    if existing == payload:
+        return "unchanged"
+
+    if write:
+        write_file(out_path, payload)
+    return "write"
+
+# ----------------------------
+# Workbook readers
+# ----------------------------
+# Each reader returns (sheet_names, open_sheet, close), where open_sheet(name) returns
+# (row_iterator, row_count). Rows are tuples of cell values using openpyxl's conventions
+# (None for blank cells, ints for whole numbers) so the helpers above work for every reader.
+# row_count includes the header row and is None when the reader cannot tell up-front.
+
+SheetOpener = Callable[[str], Tuple[Iterator[tuple], Optional[int]]]
+WORKBOOK_READERS = ("openpyxl", "calamine", "iterparse")
+
+
+def open_workbook_openpyxl(xlsx_path: Path) -> Tuple[List[str], SheetOpener, Callable[[], None]]:
+    # `data_only=True` reads the last-calculated values of formula cells.
+    # If your sheet relies on formulas that haven't been calculated/saved, values may be None.
+    # `read_only=True` streams worksheet XML instead of building the full cell DOM; the workbook
+    # keeps its file handle open in this mode, so it must be closed once all sheets are read.
+    wb = openpyxl.load_workbook(xlsx_path, data_only=True, read_only=True)
+
+    def open_sheet(sheet_name: str) -> Tuple[Iterator[tuple], Optional[int]]:
+        ws = wb[sheet_name]
+        # Read-only mode trusts the stored <dimension> and silently drops cells outside it; some
+        # writers leave it stale. Reset it so every row/column is read (the row count is then unknown).
+        ws.reset_dimensions()
+        return ws.iter_rows(values_only=True), None
+
+    return list(wb.sheetnames), open_sheet, wb.close
+
+
+def normalise_calamine_row(row: List[Any], lead_cols: int) -> tuple:
+    """Map python-calamine cell values onto openpyxl's (blank -> None, 2024.0 -> 2024,
+    date -> datetime at midnight)."""
+    out: List[Any] = [None] * lead_cols
+    for v in row:
+        if v == "":
+            v = None
+        elif isinstance(v, float) and v.is_integer():
+            v = int(v)
+        elif type(v) is dt.date:
+            # openpyxl returns datetimes for date-formatted cells; match it so string columns
+            # render (and checksum) the same whichever reader is used.
+            v = dt.datetime(v.year, v.month, v.day)
+        out.append(v)
+    return tuple(out)
+
+
+def open_workbook_calamine(xlsx_path: Path) -> Tuple[List[str], SheetOpener, Callable[[], None]]:
+    if CalamineWorkbook is None:
+        raise SystemExit("--reader calamine requires python-calamine (pip install python-calamine)")
+    wb = CalamineWorkbook.from_path(str(xlsx_path))
+
+    def open_sheet(sheet_name: str) -> Tuple[Iterator[tuple], Optional[int]]:
+        sheet = wb.get_sheet_by_name(sheet_name)
+        # iter_rows() (python-calamine 0.8) yields leading empty rows but trims leading empty
+        # columns; pad the columns back so indexes match what openpyxl reports.
+        lead_cols = sheet.start[1] if sheet.start else 0
+        rows = (normalise_calamine_row(row, lead_cols) for row in sheet.iter_rows())
+        # `end` is the last used (row, col), zero-based, so the yielded row count is end row + 1
+        # (total_height is that same zero-based index, one short of the count).
+        return rows, (sheet.end[0] + 1 if sheet.end else 0)
+
+    return list(wb.sheet_names), open_sheet, wb.close
+
+
+# The iterparse reader streams each worksheet's XML straight out of the .xlsx zip with
+# ElementTree.iterparse (stdlib only). Rows are converted and released as they are read,
+# so no cell tree is ever held in memory; only the shared strings table is.
+_XLSX_NS = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+_XLSX_REL_ID = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}id"
+_XLSX_PKG_NS = "{http://schemas.openxmlformats.org/package/2006/relationships}"
+_RE_CELL_REF = re.compile(r"^([A-Z]+)(\d+)$")
+# Number formats are classified the way openpyxl does it: built-in date/time formats by id
+# (46 "[h]:mm:ss" is elapsed time), custom ones by the tokens in their first section, ignoring
+# quoted literals and bracketed colours/locales but not the elapsed markers [h] [mm] [ss].
+_XLSX_BUILTIN_DATE_FORMATS = set(range(14, 23)) | {45, 46, 47}
+_XLSX_BUILTIN_ELAPSED_FORMATS = {46}
+_RE_FORMAT_LITERALS = re.compile(r'".*?"|\[(?!hh?\]|mm?\]|ss?\])[^\]]*\]')
+_RE_FORMAT_DATE_TOKENS = re.compile(r"(?<![_\\])[dmhys]", re.IGNORECASE)
+_RE_FORMAT_ELAPSED = re.compile(r"\[hh?\](:mm(:ss(\.0*)?)?)?|\[mm?\](:ss(\.0*)?)?|\[ss?\](\.0*)?")
+
+
+def _xlsx_column_index(letters: str) -> int:
+    """Zero-based column index from column letters (A -> 0, AA -> 26)."""
+    n = 0
+    for ch in letters:
+        n = n * 26 + (ord(ch) - 64)
+    return n - 1
+
+
+def _xlsx_text(elem: ET.Element) -> str:
+    """Concatenate the <t> runs of a shared/inline string, skipping phonetic (<rPh>) hints."""
+    parts: List[str] = []
+    for child in elem:
+        if child.tag == f"{_XLSX_NS}t":
+            parts.append(child.text or "")
+        elif child.tag == f"{_XLSX_NS}r":
+            t = child.find(f"{_XLSX_NS}t")
+            if t is not None:
+                parts.append(t.text or "")
+    return "".join(parts)
+
+
+def _xlsx_shared_strings(z: zipfile.ZipFile) -> List[str]:
+    if "xl/sharedStrings.xml" not in z.namelist():
+        return []
+    strings: List[str] = []
+    with z.open("xl/sharedStrings.xml") as f:
+        for _, elem in ET.iterparse(f):
+            if elem.tag == f"{_XLSX_NS}si":
+                strings.append(_xlsx_text(elem))
+                elem.clear()
+    return strings
+
+
+def _xlsx_date_styles(z: zipfile.ZipFile) -> Dict[int, bool]:
+    """Map cellXfs style indexes with a date/time number format to whether it is elapsed time."""
+    if "xl/styles.xml" not in z.namelist():
+        return {}
+    root = ET.fromstring(z.read("xl/styles.xml"))
+    # numFmtId -> is elapsed-time format
+    date_formats: Dict[int, bool] = {i: i in _XLSX_BUILTIN_ELAPSED_FORMATS for i in _XLSX_BUILTIN_DATE_FORMATS}
+    for nf in root.iter(f"{_XLSX_NS}numFmt"):
+        code = nf.get("formatCode", "").split(";")[0]  # only the first (positive) section
+        if _RE_FORMAT_DATE_TOKENS.search(_RE_FORMAT_LITERALS.sub("", code)):
+            date_formats[int(nf.get("numFmtId", "0"))] = _RE_FORMAT_ELAPSED.search(code) is not None
+    cell_xfs = root.find(f"{_XLSX_NS}cellXfs")
+    if cell_xfs is None:
+        return {}
+    styles: Dict[int, bool] = {}
+    for i, xf in enumerate(cell_xfs):
+        fmt_id = int(xf.get("numFmtId", "0"))
+        if fmt_id in date_formats:
+            styles[i] = date_formats[fmt_id]
+    return styles
+
+
+def _xlsx_serial_to_datetime(serial: float, date1904: bool, elapsed: bool) -> Any:
+    """Convert an Excel serial as openpyxl does: timedelta for elapsed-time formats, time for
+    serials below 1 (time-only values), otherwise datetime."""
+    if elapsed:
+        td = dt.timedelta(days=serial)
+        if td.microseconds:
+            # round to millisecond precision
+            td = dt.timedelta(seconds=td.total_seconds() // 1, microseconds=round(td.microseconds, -3))
+        return td
+    day, fraction = divmod(serial, 1)
+    diff = dt.timedelta(milliseconds=round(fraction * 86400 * 1000))
+    if 0 <= serial < 1 and diff.days == 0:
+        return (dt.datetime.min + diff).time()
+    if date1904:
+        return dt.datetime(1904, 1, 1) + dt.timedelta(days=day) + diff
+    # Excel's 1900 date system counts a non-existent 1900-02-29 (serial 60)
+    if 0 < serial < 60:
+        day += 1
+    return dt.datetime(1899, 12, 30) + dt.timedelta(days=day) + diff
+
+
+def _xlsx_iso_value(text: str) -> Any:
+    """Value of a t="d" (ISO 8601) cell, typed as openpyxl returns it: datetime, date or time."""
+    if "T" in text:
+        return dt.datetime.fromisoformat(text)
+    if ":" in text:
+        return dt.time.fromisoformat(text)
+    return dt.date.fromisoformat(text)
+
+
+def _xlsx_cell_value(c: ET.Element, shared: List[str], date_styles: Dict[int, bool], date1904: bool) -> Any:
+    t = c.get("t", "n")
+    if t == "inlineStr":
+        inline = c.find(f"{_XLSX_NS}is")
+        return _xlsx_text(inline) if inline is not None else None
+    v = c.find(f"{_XLSX_NS}v")
+    if v is None or v.text is None:
+        return None
+    text = v.text
+    if t == "s":
+        return shared[int(text)]
+    if t == "b":
+        return text == "1"
+    if t in ("str", "e"):
+        return text
+    if t == "d":
+        return _xlsx_iso_value(text)
+    # Numbers: same int/float rule as openpyxl, then dates for date-formatted cells
+    num: Any = float(text) if ("." in text or "E" in text or "e" in text) else int(text)
+    elapsed = date_styles.get(int(c.get("s", "0")))
+    if elapsed is not None:
+        return _xlsx_serial_to_datetime(num, date1904, elapsed)
+    return num
+
+
+def open_workbook_iterparse(xlsx_path: Path) -> Tuple[List[str], SheetOpener, Callable[[], None]]:
+    z = zipfile.ZipFile(xlsx_path)
+
+    # Sheet name -> worksheet part, via the workbook's relationships
+    rels_root = ET.fromstring(z.read("xl/_rels/workbook.xml.rels"))
+    targets: Dict[str, str] = {}
+    for rel in rels_root.iter(f"{_XLSX_PKG_NS}Relationship"):
+        target = rel.get("Target", "")
+        targets[rel.get("Id", "")] = target.lstrip("/") if target.startswith("/") else posixpath.join("xl", target)
+    wb_root = ET.fromstring(z.read("xl/workbook.xml"))
+    sheet_parts: Dict[str, str] = {}
+    for sheet in wb_root.iter(f"{_XLSX_NS}sheet"):
+        sheet_parts[sheet.get("name", "")] = targets.get(sheet.get(_XLSX_REL_ID, ""), "")
+    wb_pr = wb_root.find(f"{_XLSX_NS}workbookPr")
+    date1904 = wb_pr is not None and wb_pr.get("date1904") in ("1", "true")
+
+    shared = _xlsx_shared_strings(z)
+    date_styles = _xlsx_date_styles(z)
+
+    def sheet_row_count(part: str) -> Optional[int]:
+        # <dimension ref="A1:X107"> sits near the top of the sheet; stop reading once it is found.
+        with z.open(part) as f:
+            for _, elem in ET.iterparse(f, events=("start",)):
+                if elem.tag == f"{_XLSX_NS}dimension":
+                    m = _RE_CELL_REF.match(elem.get("ref", "").split(":")[-1])
+                    return int(m.group(2)) if m else None
+                if elem.tag == f"{_XLSX_NS}sheetData":
+                    return None
+        return None
+
+    def rows(part: str) -> Iterator[tuple]:
+        with z.open(part) as f:
+            sheet_data: Optional[ET.Element] = None
+            next_row = 1
+            for event, elem in ET.iterparse(f, events=("start", "end")):
+                if event == "start":
+                    if elem.tag == f"{_XLSX_NS}sheetData":
+                        sheet_data = elem
+                    continue
+                if elem.tag != f"{_XLSX_NS}row":
+                    continue
+                row_num = int(elem.get("r", next_row))
+                # Rows with no cells are omitted from the XML; emit them as empty rows.
+                while next_row < row_num:
+                    yield ()
+                    next_row += 1
+                values: List[Any] = []
+                for c in elem.iter(f"{_XLSX_NS}c"):
+                    ref = c.get("r")
+                    m = _RE_CELL_REF.match(ref) if ref else None
+                    if m:
+                        col = _xlsx_column_index(m.group(1))
+                        if col > len(values):
+                            values.extend([None] * (col - len(values)))
+                    values.append(_xlsx_cell_value(c, shared, date_styles, date1904))
+                yield tuple(values)
+                next_row = row_num + 1
+                # Release the parsed row (and the parent's reference to it) straight away.
+                elem.clear()
+                if sheet_data is not None:
+                    sheet_data.clear()
+
+    def open_sheet(sheet_name: str) -> Tuple[Iterator[tuple], Optional[int]]:
+        part = sheet_parts[sheet_name]
+        return rows(part), sheet_row_count(part)
+
+    return list(sheet_parts), open_sheet, z.close
+
+
+# ----------------------------
+# CLI helpers
+# ----------------------------
+
+def positive_int(raw: str) -> int:
+    """argparse type for counts that must be >= 1."""
+    try:
+        n = int(raw)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {raw!r}")
+    if n < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {n}")
+    return n
+
+
 # ----------------------------
 # Main program
 # ----------------------------
@@ -384,6 +806,17 @@ def main() -> None:
     ap.add_argument("--themes-sheet", default="Themes", help="Worksheet name for theme master data")
     ap.add_argument("--theme-series-sheet", default="ThemeSeries", help="Worksheet name for theme->series links")
 
+    # Input
+    ap.add_argument(
+        "--reader",
+        choices=WORKBOOK_READERS,
+        default="calamine" if CalamineWorkbook is not None else "openpyxl",
+        help=(
+            "Workbook parser (default: calamine if python-calamine is installed, else openpyxl; "
+            "iterparse streams the sheet XML with the standard library only)"
+        ),
+    )
+
     # Output
     ap.add_argument("--output-dir", default="_works", help="Output folder for generated work pages")
     ap.add_argument("--themes-output-dir", default="_themes", help="Output folder for generated theme pages")
@@ -394,7 +827,13 @@ def main() -> None:
 
     # Write controls
     ap.add_argument("--write", action="store_true", help="Actually write files (otherwise dry-run)")
-    ap.add_argument("--force", action="store_true", help="Overwrite existing files")
+    ap.add_argument(
+        "--jobs",
+        type=positive_int,
+        default=1,
+        help="Worker threads for reading/writing work pages (default: 1; pages are still reported in order)",
+    )
+    ap.add_argument("--force", action="store_true", help="Ignore stored checksums/hashes and regenerate (identical files are still not rewritten)")
     args = ap.parse_args()
 
     # Resolve the workbook path and fail fast if it is missing.
@@ -402,23 +841,27 @@ def main() -> None:
     if not xlsx_path.exists():
         raise SystemExit(f"Workbook not found: {xlsx_path}")
 
-    # `data_only=True` reads the last-calculated values of formula cells.
-    # If your sheet relies on formulas that haven't been calculated/saved, values may be None.
-    wb = openpyxl.load_workbook(xlsx_path, data_only=True)
+    if args.reader == "calamine":
+        sheet_names, open_sheet, close_workbook = open_workbook_calamine(xlsx_path)
+    elif args.reader == "iterparse":
+        sheet_names, open_sheet, close_workbook = open_workbook_iterparse(xlsx_path)
+    else:
+        sheet_names, open_sheet, close_workbook = open_workbook_openpyxl(xlsx_path)
 
-    def read_sheet_rows(sheet_name: str) -> List[tuple]:
-        if sheet_name not in wb.sheetnames:
+    def get_sheet(sheet_name: str) -> Tuple[Iterator[tuple], Optional[int]]:
+        if sheet_name not in sheet_names:
             raise SystemExit(f"Sheet not found in workbook: {sheet_name}")
-        ws = wb[sheet_name]
-        rows = list(ws.iter_rows(values_only=True))
-        if not rows:
-            return []
-        return rows
+        return open_sheet(sheet_name)
 
-    def build_header_index(rows: List[tuple]) -> Dict[str, int]:
-        if not rows:
+    def read_sheet_rows(sheet_name: str) -> List[tuple]:
+        # Small lookup sheets are read into memory since they are iterated more than once.
+        rows, _ = get_sheet(sheet_name)
+        return list(rows)
+
+    def build_header_index(header_row: Optional[tuple]) -> Dict[str, int]:
+        if not header_row:
             return {}
-        headers = [str(h).strip() if h is not None else "" for h in rows[0]]
+        headers = [str(h).strip() if h is not None else "" for h in header_row]
         hi: Dict[str, int] = {}
         for i, h in enumerate(headers):
             if not h:
@@ -429,8 +872,7 @@ def main() -> None:
         return hi
 
     def cell(row: tuple, header_index: Dict[str, int], col_name: str) -> Any:
-        i = header_index.get(col_name)
-        return None if i is None or i >= len(row) else row[i]
+        return cell_at(row, header_index.get(col_name))
 
     # Output directory:
     # - Use `works` for a normal pages folder.
@@ -453,21 +895,22 @@ def main() -> None:
     series_json_dir = Path(args.series_json_dir).expanduser()
     series_json_dir.mkdir(parents=True, exist_ok=True)
 
-    # Load all worksheets up-front.
-    works_rows = read_sheet_rows(args.works_sheet)
+    # Load the small lookup worksheets up-front; the Works sheet is streamed row by row below.
+    works_iter, works_row_count = get_sheet(args.works_sheet)
     series_rows = read_sheet_rows(args.series_sheet)
     themes_rows = read_sheet_rows(args.themes_sheet)
     theme_series_rows = read_sheet_rows(args.theme_series_sheet)
     files_rows = read_sheet_rows(args.files_sheet)
 
-    if not works_rows:
+    works_header = next(works_iter, None)
+    if works_header is None:
         raise SystemExit(f"Works sheet '{args.works_sheet}' is empty")
 
-    works_hi = build_header_index(works_rows)
-    series_hi = build_header_index(series_rows) if series_rows else {}
-    themes_hi = build_header_index(themes_rows) if themes_rows else {}
-    theme_series_hi = build_header_index(theme_series_rows) if theme_series_rows else {}
-    files_hi = build_header_index(files_rows) if files_rows else {}
+    works_hi = build_header_index(works_header)
+    series_hi = build_header_index(series_rows[0]) if series_rows else {}
+    themes_hi = build_header_index(themes_rows[0]) if themes_rows else {}
+    theme_series_hi = build_header_index(theme_series_rows[0]) if theme_series_rows else {}
+    files_hi = build_header_index(files_rows[0]) if files_rows else {}
 
     # Pre-index series titles by series_id
     series_title_by_id: Dict[str, str] = {}
@@ -482,25 +925,6 @@ def main() -> None:
             continue
         series_title_by_id[sid] = title
 
-    # Pre-index work_ids by series_id (from Works sheet)
-    work_ids_by_series: Dict[str, List[str]] = {}
-    for wr in works_rows[1:]:
-        sid_raw = cell(wr, works_hi, "series_id")
-        if is_empty(sid_raw):
-            continue
-        sid = require_slug_safe("series_id", sid_raw)
-
-        wid_raw = cell(wr, works_hi, "work_id")
-        if is_empty(wid_raw):
-            continue
-        wid = slug_id(wid_raw)
-
-        work_ids_by_series.setdefault(sid, []).append(wid)
-
-    # Ensure deterministic ordering (alpha) for each series' work_ids
-    for sid in list(work_ids_by_series.keys()):
-        work_ids_by_series[sid] = sorted(work_ids_by_series[sid])
-
     # Pre-index files by work_id
     files_by_work: Dict[str, List[Dict[str, Any]]] = {}
     for r in files_rows[1:] if len(files_rows) > 1 else []:
@@ -516,47 +940,70 @@ def main() -> None:
             continue
         files_by_work.setdefault(wid, []).append(item)
 
+    # Resolve Works column indexes once; they are the same for every row.
+    build_works_front_matter = make_works_front_matter_builder(works_hi, series_title_by_id)
+    work_id_idx = works_hi.get("work_id")
+    series_id_idx = works_hi.get("series_id")
+    tags_idx = works_hi.get("tags")
+
+    # work_ids by series_id, collected while streaming the Works sheet (used for series JSON)
+    work_ids_by_series: Dict[str, List[str]] = {}
+
+    # Pass 1 streams the Works sheet, validating and rendering every row before anything is
+    # written, so a bad row (e.g. a non-slug series_id) stops the run with no output touched.
+    # Rendered pages are small; only (prefix, file name, content, checksum) is kept per work.
+    rendered_pages: List[Tuple[str, str, str, str]] = []
+
+    # List the output folder once instead of stat()ing each work page's path.
+    existing_work_files = {entry.name for entry in os.scandir(out_dir) if entry.is_file()}
+
     written = 0
     skipped = 0
-    total = max(len(works_rows) - 1, 0)  # exclude header row
+    # Row count comes from the reader; openpyxl's read-only mode may not know it.
+    total = max((works_row_count or 1) - 1, 0)  # exclude header row
     processed = 0
 
-    # Iterate each Works row and emit one Markdown file per work.
-    for r in works_rows[1:]:
+    def report_work_page(prefix: str, out_name: str, out_path: Path, exists: bool, status: str) -> None:
+        nonlocal written, skipped
+        if status == "checksum":
+            print(f"{prefix}SKIP (checksum match): {out_path}")
+            skipped += 1
+        elif status == "unchanged":
+            print(f"{prefix}SKIP (no change): {out_path}")
+            skipped += 1
+        elif args.write:
+            existing_work_files.add(out_name)
+            print(f"{prefix}WRITE: {out_path}")
+            written += 1
+        else:
+            print(f"{prefix}DRY-RUN: would write {out_path} (overwrite={exists})")
+            written += 1
+
+    # Iterate each Works row and render one Markdown page per work.
+    for r in works_iter:
         processed += 1
-        prefix = f"[{processed}/{total}] "
-        raw_work_id = cell(r, works_hi, "work_id")
+        prefix = f"[{processed}/{total}] " if total else f"[{processed}] "
+
+        # Every series_id is validated, including rows that are skipped for a missing work_id.
+        series_id_raw = cell_at(r, series_id_idx)
+        row_series_id = None if is_empty(series_id_raw) else require_slug_safe("series_id", series_id_raw)
+
+        raw_work_id = cell_at(r, work_id_idx)
         if is_empty(raw_work_id):
             skipped += 1
             continue
 
         wid = slug_id(raw_work_id)
 
+        if row_series_id is not None:
+            work_ids_by_series.setdefault(row_series_id, []).append(wid)
+
         # Tags: comma-separated in Excel
-        tags = parse_list(cell(r, works_hi, "tags"), sep=",")
+        tags = parse_list(cell_at(r, tags_idx), sep=",")
 
         # Fields in stable order (matches your canonical front matter schema)
         fm: Dict[str, Any] = {"work_id": wid}
-        fm.update(build_works_front_matter(r, works_hi))
-
-        # Series title lookup (Works.series_id -> series_id; Series.series_title -> series_title)
-        sid = fm.get("series_id")
-        if isinstance(sid, str) and sid.strip() != "":
-            fm["series_title"] = series_title_by_id.get(sid.strip())
-        else:
-            fm["series_title"] = None
-
-        # Reorder for clarity: ensure series_title immediately follows series_id in YAML
-        if "series_id" in fm and "series_title" in fm:
-            _st = fm.get("series_title")
-            fm_ordered: Dict[str, Any] = {}
-            for k, v in fm.items():
-                if k == "series_title":
-                    continue  # will be inserted right after series_id
-                fm_ordered[k] = v
-                if k == "series_id":
-                    fm_ordered["series_title"] = _st
-            fm = fm_ordered
+        fm.update(build_works_front_matter(r))
 
         fm["tags"] = tags
 
@@ -569,24 +1016,54 @@ def main() -> None:
         checksum = compute_work_checksum(fm)
         fm["checksum"] = checksum
 
-        content = build_front_matter(fm) + "\n"
+        content = build_front_matter(fm, body="")
+        rendered_pages.append((prefix, f"{wid}.md", content, checksum))
 
-        out_path = out_dir / f"{wid}.md"
-        exists = out_path.exists()
+    close_workbook()
 
-        existing_checksum = extract_existing_checksum(out_path) if exists else None
-        if (existing_checksum is not None) and (existing_checksum == checksum) and (not args.force):
-            print(f"{prefix}SKIP (checksum match): {out_path}")
-            skipped += 1
-            continue
+    # Pass 2: compare with the files on disk and write.
+    if args.jobs == 1:
+        for prefix, out_name, content, checksum in rendered_pages:
+            out_path = out_dir / out_name
+            exists = out_name in existing_work_files
+            status = sync_work_page(out_path, content, checksum, exists, args.force, args.write)
+            report_work_page(prefix, out_name, out_path, exists, status)
+    else:
+        # File reads/writes run on a thread pool. Results are reported strictly in row order;
+        # at most jobs * 4 pages are in flight.
+        pending: Deque[Tuple[str, str, Path, bool, Future]] = deque()
+
+        def drain_pending(keep: int = 0) -> None:
+            while len(pending) > keep:
+                prefix_p, name_p, path_p, exists_p, fut = pending.popleft()
+                report_work_page(prefix_p, name_p, path_p, exists_p, fut.result())
+
+        with ThreadPoolExecutor(max_workers=args.jobs) as pool:
+            try:
+                for prefix, out_name, content, checksum in rendered_pages:
+                    out_path = out_dir / out_name
+                    # A repeated work_id must see the earlier write for the same file, so finish
+                    # in-flight pages first.
+                    if any(p[1] == out_name for p in pending):
+                        drain_pending()
+                    exists = out_name in existing_work_files
+                    fut = pool.submit(sync_work_page, out_path, content, checksum, exists, args.force, args.write)
+                    pending.append((prefix, out_name, out_path, exists, fut))
+                    drain_pending(keep=args.jobs * 4)
+                drain_pending()
+            except BaseException:
+                # Cancel queued pages, then report the ones that already ran so the log matches
+                # what is on disk before the error propagates.
+                for *_, fut in pending:
+                    fut.cancel()
+                for prefix_p, name_p, path_p, exists_p, fut in pending:
+                    if not fut.cancelled() and fut.exception() is None:
+                        report_work_page(prefix_p, name_p, path_p, exists_p, fut.result())
+                raise
 
-        if args.write:
-            out_path.write_text(content, encoding="utf-8")
-            print(f"{prefix}WRITE: {out_path}")
-            written += 1
-        else:
-            print(f"{prefix}DRY-RUN: would write {out_path} (overwrite={exists})")
-            written += 1
+    # Ensure deterministic ordering (alpha) for each series' work_ids
+    for sid in list(work_ids_by_series.keys()):
+        work_ids_by_series[sid] = sorted(work_ids_by_series[sid])
 
     print(f"\nDone. {'Would write' if not args.write else 'Wrote'}: {written}. Skipped: {skipped}.")
 
@@ -631,6 +1108,7 @@ def main() -> None:
         if theme_series_rows and len(theme_series_rows) >= 2:
             # Collect rows with optional sort_order
             tmp: Dict[str, List[tuple]] = {k: [] for k in themes_by_id.keys()}
+            has_sort_order_col = "sort_order" in theme_series_hi
             for lr in theme_series_rows[1:]:
                 # ThemeSeries may reference the theme either by theme_id (preferred) or theme_title.
                 tid_raw = cell(lr, theme_series_hi, "theme_id")
@@ -656,7 +1134,7 @@ def main() -> None:
                 series_id = require_slug_safe("series_id", sid_raw)
 
                 so_raw = cell(lr, theme_series_hi, "sort_order")
-                so = coerce_int(so_raw) if "sort_order" in theme_series_hi else None
+                so = coerce_int(so_raw) if has_sort_order_col else None
                 sort_key = so if so is not None else 10_000_000
                 tmp[theme_id].append((sort_key, series_id))
 
@@ -693,24 +1171,18 @@ def main() -> None:
             tfm["checksum"] = theme_checksum
 
             body = f"{{% include theme_prose/{theme_id}.md %}}\n"
-            theme_content = build_front_matter(tfm) + "\n" + body
+            theme_payload = build_front_matter(tfm, body=body).encode("utf-8")
 
             theme_path = themes_out_dir / f"{theme_id}.md"
-            existing_text = None
-            if theme_path.exists():
-                try:
-                    existing_text = theme_path.read_text(encoding="utf-8")
-                except Exception:
-                    existing_text = None
-
-            # Write policy: overwrite if content differs, or if --force; dry-run unless --write
-            needs_write = (existing_text != theme_content)
-            if (not needs_write) and (not args.force):
+            existing_payload = read_existing_bytes(theme_path)
+
+            # Write policy: overwrite only if content differs; dry-run unless --write
+            if existing_payload == theme_payload:
                 print(f"{prefix_t}SKIP (no change): {theme_path}")
                 themes_skipped += 1
             else:
                 if args.write:
-                    theme_path.write_text(theme_content, encoding="utf-8")
+                    write_file(theme_path, theme_payload)
                     print(f"{prefix_t}WRITE: {theme_path}")
                     themes_written += 1
                 else:
@@ -725,7 +1197,7 @@ def main() -> None:
                     "<!-- Replace this placeholder with the theme's prose. -->\n"
                 )
                 if args.write:
-                    prose_path.write_text(placeholder, encoding="utf-8")
+                    write_file(prose_path, placeholder.encode("utf-8"))
                     print(f"{prefix_t}WRITE prose placeholder: {prose_path}")
                 else:
                     print(f"{prefix_t}DRY-RUN: would create prose placeholder {prose_path}")
@@ -751,27 +1223,36 @@ def main() -> None:
         s_total = max(len(series_rows) - 1, 0)
         s_processed = 0
 
+        # Column presence is the same for every row; check it once.
+        has_year_col = "year" in series_hi
+        has_year_display_col = "year_display" in series_hi
+
+        # Validated series_id per Series row (None for blank rows), reused by the JSON pass below.
+        series_ids: List[Optional[str]] = []
+
         for sr in series_rows[1:]:
             s_processed += 1
             prefix_s = f"[series {s_processed}/{s_total}] "
 
             sid_raw = cell(sr, series_hi, "series_id")
             if is_empty(sid_raw):
+                series_ids.append(None)
                 series_skipped += 1
                 continue
             series_id = require_slug_safe("series_id", sid_raw)
+            series_ids.append(series_id)
 
             title_raw = cell(sr, series_hi, "series_title")
             series_title = coerce_string(title_raw) or series_id
 
             # Numeric year (optional)
-            year = coerce_int(cell(sr, series_hi, "year")) if "year" in series_hi else None
+            year = coerce_int(cell(sr, series_hi, "year")) if has_year_col else None
 
             # year_display handling:
             # - If Series sheet has a year_display column, use it (may be null).
             # - If it does NOT have year_display, fall back to numeric year rendered as text
             year_display: Optional[str]
-            if "year_display" in series_hi:
+            if has_year_display_col:
                 year_display = coerce_string(cell(sr, series_hi, "year_display"))
             else:
                 # Fall back to numeric year rendered as text
@@ -789,23 +1270,17 @@ def main() -> None:
             sfm["checksum"] = s_checksum
 
             body = f"{{% include series_prose/{series_id}.md %}}\n"
-            series_content = build_front_matter(sfm) + "\n" + body
+            series_payload = build_front_matter(sfm, body=body).encode("utf-8")
 
             series_path = series_out_dir / f"{series_id}.md"
-            existing_text = None
-            if series_path.exists():
-                try:
-                    existing_text = series_path.read_text(encoding="utf-8")
-                except Exception:
-                    existing_text = None
-
-            needs_write = (existing_text != series_content)
-            if (not needs_write) and (not args.force):
+            existing_payload = read_existing_bytes(series_path)
+
+            if existing_payload == series_payload:
                 print(f"{prefix_s}SKIP (no change): {series_path}")
                 series_skipped += 1
             else:
                 if args.write:
-                    series_path.write_text(series_content, encoding="utf-8")
+                    write_file(series_path, series_payload)
                     print(f"{prefix_s}WRITE: {series_path}")
                     series_written += 1
                 else:
@@ -820,7 +1295,7 @@ def main() -> None:
                     "<!-- Replace this placeholder with the series' prose. -->\n"
                 )
                 if args.write:
-                    prose_path.write_text(placeholder, encoding="utf-8")
+                    write_file(prose_path, placeholder.encode("utf-8"))
                     print(f"{prefix_s}WRITE prose placeholder: {prose_path}")
                 else:
                     print(f"{prefix_s}DRY-RUN: would create prose placeholder {prose_path}")
@@ -840,18 +1315,16 @@ def main() -> None:
 
         sj_written = 0
         sj_skipped = 0
-        sj_total = max(len(series_rows) - 1, 0)
+        sj_total = len(series_ids)
         sj_processed = 0
 
-        for sr in series_rows[1:]:
+        for series_id in series_ids:
             sj_processed += 1
             prefix_j = f"[seriesjson {sj_processed}/{sj_total}] "
 
-            sid_raw = cell(sr, series_hi, "series_id")
-            if is_empty(sid_raw):
+            if series_id is None:
                 sj_skipped += 1
                 continue
-            series_id = require_slug_safe("series_id", sid_raw)
 
             work_ids = work_ids_by_series.get(series_id, [])
             series_hash = compute_series_hash(series_id, work_ids)
@@ -865,20 +1338,25 @@ def main() -> None:
                 "work_ids": work_ids,
             }
 
+            json_payload = (json.dumps(payload, ensure_ascii=False, indent=2) + "\n").encode("utf-8")
+
             out_json_path = series_json_dir / f"{series_id}.json"
-            exists = out_json_path.exists()
+            existing_payload = read_existing_bytes(out_json_path)
+            exists = existing_payload is not None
 
-            existing_hash = extract_existing_series_hash(out_json_path) if exists else None
+            existing_hash = extract_existing_series_hash(existing_payload) if exists else None
             if (existing_hash is not None) and (existing_hash == series_hash) and (not args.force):
                 print(f"{prefix_j}SKIP (hash match): {out_json_path}")
                 sj_skipped += 1
                 continue
 
+            if existing_payload == json_payload:
+                print(f"{prefix_j}SKIP (no change): {out_json_path}")
+                sj_skipped += 1
+                continue
+
             if args.write:
-                out_json_path.write_text(
-                    json.dumps(payload, ensure_ascii=False, indent=2) + "\n",
-                    encoding="utf-8",
-                )
+                write_file(out_json_path, json_payload)
                 print(f"{prefix_j}WRITE: {out_json_path}")
                 sj_written += 1
             else: